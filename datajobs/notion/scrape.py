@@ -1,22 +1,30 @@
 # native Python packages
+import asyncio
 import hashlib
 import os
 import time
-from typing import Optional
-from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from datetime import datetime, timezone
 from urllib.parse import urlparse
 
 # third-party packages
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+from selectolax.lexbor import LexborHTMLParser
 
 # custom packages
-from utils.file_io import write_to_json
+from utils.file_io import compress_to_base64, read_jsonl, write_jsonl, write_to_json
 from utils.logger import get_console_logger
 
 
 NOTION_DOMAIN = "notion.so"
+REQUEST_EXCEPTIONS = (aiohttp.ClientError, asyncio.TimeoutError)
+REQUEST_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; notion-help-scraper)"}
+# Links with these prefixes never point to another page, so they are ignored without being parsed
+IGNORED_HREF_PREFIXES = ("#", "mailto:", "javascript:", "tel:")
+
+logger = get_console_logger(__name__)
 
 
 def is_valid_url(url: str) -> bool:
@@ -39,6 +47,7 @@ def is_valid_url(url: str) -> bool:
     )
 
 
+@lru_cache(maxsize=10000)
 def get_canonical_url(url: str) -> str:
     """
     Get the canonical URL of a given URL.
@@ -46,7 +55,8 @@ def get_canonical_url(url: str) -> str:
     Canonical URL is the URL composed of only https protocol, domain, and URL path.
     It ignores query parameters and fragments.
 
-    This is useful to
+    The result is memoized because the same links (e.g. navigation) appear on most pages.
+
     Args:
         url (str): The URL to parse.
 
@@ -58,106 +68,222 @@ def get_canonical_url(url: str) -> str:
     return f"https://{NOTION_DOMAIN}{parsed_url.path}"
 
 
-def make_request(
-    url: str, timeout: int = 10, max_attempts: int = 3, backoff_factor: int = 1
-) -> Optional[requests.Response]:
+def get_checksum(content: bytes) -> str:
     """
-    Makes an HTTP GET request with retry logic.
+    Get the checksum of a response body.
 
     Args:
+        content (bytes): The response body.
+
+    Returns:
+        str: The MD5 hex digest of the body.
+    """
+    return hashlib.md5(content, usedforsecurity=False).hexdigest()
+
+
+async def make_request(
+    session: aiohttp.ClientSession,
+    url: str,
+    timeout: int = 10,
+    max_attempts: int = 3,
+    backoff_factor: int = 1,
+    headers: Optional[dict] = None,
+) -> Tuple[aiohttp.ClientResponse, bytes]:
+    """
+    Makes an asynchronous HTTP GET request with retry logic.
+
+    The response body is read before the connection is released and returned alongside the response.
+    Responses with a redirection status such as 304 Not Modified are returned as they are, so callers can branch on it.
+
+    Args:
+        session (aiohttp.ClientSession): The session used to make the request.
         url (str): The URL to request.
         timeout (int): The number of seconds to wait for a response. Default is 10.
         max_attempts (int): Maximum number of retry attempts. Default is 3.
         backoff_factor (int): Factor to multiply the delay between retries. Default is 1.
+        headers (Optional[dict]): Additional request headers, e.g. for conditional requests. Default is None.
 
     Returns:
-        Optional[requests.Response]: The response object if the request is successful,
-                                     or None if all retry attempts fail.
+        Tuple[aiohttp.ClientResponse, bytes]: The response object and its body if the request is successful.
+
+    Raises:
+        aiohttp.ClientError, asyncio.TimeoutError: If all retry attempts fail.
     """
-    logger = get_console_logger(__name__)
     attempt = 1
     while attempt <= max_attempts:
         try:
-            response = requests.get(url, timeout=timeout)
-            response.raise_for_status()
-            return response
-        except requests.exceptions.RequestException as e:
+            async with session.get(
+                url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                response.raise_for_status()
+                content = await response.read()
+                return response, content
+        except REQUEST_EXCEPTIONS as e:
             if attempt == max_attempts:
                 raise e
             delay = backoff_factor * 2 ** (attempt - 1)  # Exponential backoff
             logger.error(
                 f"Failed to fetch a webpage. URL: {url}. Attempt: {attempt}. Reason: {e}. Retrying in {delay} sec."
             )
-            time.sleep(delay)
+            await asyncio.sleep(delay)
 
         attempt += 1
 
 
-def scrape(root_url: str, output_dir: Optional[str] = None) -> None:
+async def scrape(
+    root_url: str, output_dir: Optional[str] = None, concurrency: int = 20
+) -> None:
     start_time = time.time()
-    logger = get_console_logger(__name__)
 
     logger.info("Scrape Notion's Help articles")
 
     if not is_valid_url(root_url):
         raise ValueError("The URL is not a valid Notion Help URL")
 
-    queue = OrderedDict()
-    queue[root_url] = None
+    if not output_dir:
+        project_root = os.getenv("PROJECT_ROOT")
+        output_dir = os.path.join(project_root, "datasets", "notion", "raw")
+    results_filepath = os.path.join(output_dir, "results.jsonl")
+
+    # Results of the previous scrape, used to skip fetching and parsing pages that have not changed since
+    previous_results = {}
+    if os.path.exists(results_filepath):
+        previous_results = {
+            record["url"]: record for record in read_jsonl(results_filepath)
+        }
+
+    # The queue is unbounded (and backed by a deque), so put_nowait never fails and avoids awaiting a coroutine
+    queue = asyncio.Queue()
+    queue.put_nowait(root_url)
+    queued_urls = {root_url}
     visited_urls = set()
     failed_urls = set()
     skipped_urls = set()
     valid_results = {}
 
-    while queue:
-        url, _ = queue.popitem(last=False)
+    # Hashing and compressing bodies release the GIL, so run them in threads while the event loop keeps fetching
+    loop = asyncio.get_running_loop()
+    io_pool = ThreadPoolExecutor(max_workers=2)
+
+    def extract_links(html_body: bytes) -> List[str]:
+        # Only the links are needed here, so use the lightweight lexbor parser instead of building a full soup.
+        # It takes the raw bytes, so the body is never decoded into a str.
+        tree = LexborHTMLParser(html_body)
+
+        canonical_urls = []
+        for link in tree.css("a[href]"):
+            href = link.attributes.get("href")
+            if not href or href.startswith(IGNORED_HREF_PREFIXES):
+                continue
+
+            canonical_url = get_canonical_url(href)
+            if canonical_url:
+                canonical_urls.append(canonical_url)
+            else:
+                skipped_urls.add(href)
+                logger.warning(f"Failed to extract a canonical URL. URL: {href}")
+
+        return list(dict.fromkeys(canonical_urls))
+
+    async def visit(session: aiohttp.ClientSession, url: str) -> None:
         logger.info(f"Visiting a webpage. URL: {url}")
         visited_urls.add(url)
 
+        # Ask the server to skip the body if the page has not changed since the previous scrape
+        previous_result = previous_results.get(url)
+        headers = {}
+        if previous_result and "links" in previous_result:
+            if previous_result.get("etag"):
+                headers["If-None-Match"] = previous_result["etag"]
+            if previous_result.get("last_modified"):
+                headers["If-Modified-Since"] = previous_result["last_modified"]
+
         try:
-            response = make_request(url)
-        except requests.exceptions.RequestException as e:
+            response, content = await make_request(session, url, headers=headers)
+        except REQUEST_EXCEPTIONS as e:
             logger.error(
                 f"Failed to fetch a webpage. Will stop the attempt. URL: {url}: Reason: {e}"
             )
             failed_urls.add(url)
-            continue
-
-        valid_results[url] = {
-            "status_code": response.status_code,
-            "checksum": hashlib.md5(response.text.encode()).hexdigest(),
-            "html_body": response.text,
-        }
-
-        html_body = response.text
-        soup = BeautifulSoup(html_body, "html.parser")
-
-        links = soup.find_all("a")
-        for link in links:
-            href = link.get("href")
-            canonical_url = get_canonical_url(href)
-            if canonical_url:
-                if (
-                    canonical_url not in visited_urls
-                    and canonical_url not in skipped_urls
-                    and canonical_url not in queue
-                ):
-                    if is_valid_url(canonical_url):
-                        queue[canonical_url] = None
-                    else:
-                        skipped_urls.add(canonical_url)
+            return
+
+        if response.status == 304:  # Not Modified
+            valid_results[url] = previous_result
+            links = previous_result["links"]
+        else:
+            checksum = await loop.run_in_executor(io_pool, get_checksum, content)
+            if (
+                previous_result
+                and previous_result["checksum"] == checksum
+                and "links" in previous_result
+            ):
+                links = previous_result["links"]
+                html_body_zstd = previous_result["html_body_zstd"]
             else:
-                skipped_urls.add(href)
-                logger.warning(f"Failed to extract a canonical URL. URL: {href}")
+                # HTML compresses well, so keep the stored body small on disk and in memory.
+                # The compression runs in the background while the links are extracted.
+                compression = loop.run_in_executor(io_pool, compress_to_base64, content)
+                links = extract_links(content)
+                html_body_zstd = await compression
+
+            valid_results[url] = {
+                "url": url,
+                "status_code": response.status,
+                "checksum": checksum,
+                "html_body_zstd": html_body_zstd,
+                "links": links,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+
+        for canonical_url in links:
+            if (
+                canonical_url not in visited_urls
+                and canonical_url not in skipped_urls
+                and canonical_url not in queued_urls
+            ):
+                if is_valid_url(canonical_url):
+                    queued_urls.add(canonical_url)
+                    queue.put_nowait(canonical_url)
+                else:
+                    skipped_urls.add(canonical_url)
+
+    async def worker(session: aiohttp.ClientSession) -> None:
+        while True:
+            url = await queue.get()
+            queued_urls.discard(url)
+            try:
+                await visit(session, url)
+            except Exception:
+                logger.exception(
+                    f"Unexpected error while visiting a webpage. URL: {url}"
+                )
+                failed_urls.add(url)
+            finally:
+                queue.task_done()
+
+    # Every page lives on the same host, so keep the pooled connections alive and the DNS entry cached
+    # for the whole scrape instead of paying for a new TCP + TLS handshake per page.
+    connector = aiohttp.TCPConnector(
+        limit=concurrency,
+        limit_per_host=concurrency,
+        keepalive_timeout=30,
+        ttl_dns_cache=300,
+    )
+    with io_pool:
+        async with aiohttp.ClientSession(
+            connector=connector, headers=REQUEST_HEADERS
+        ) as session:
+            workers = [asyncio.create_task(worker(session)) for _ in range(concurrency)]
+            await queue.join()
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
     logger.info(
         "Scraping for Notion's Help articles completed. Start the data write process."
     )
 
-    if not output_dir:
-        project_root = os.getenv("PROJECT_ROOT")
-        output_dir = os.path.join(project_root, "datasets", "notion", "raw")
-
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
@@ -180,13 +306,24 @@ def scrape(root_url: str, output_dir: Optional[str] = None) -> None:
             "%Y-%m-%d %H:%M:%S.%f"
         ),
     }
-    data = {
-        "metadata": metadata,
-        "results": valid_results,
-    }
 
     metadata_filepath = os.path.join(output_dir, "metadata.json")
     write_to_json(metadata_filepath, metadata)
 
-    data_filepath = os.path.join(output_dir, "data.json")
-    write_to_json(data_filepath, data)
+    # One record per line, so the transform step can stream pages instead of loading the whole corpus
+    write_jsonl(results_filepath, valid_results.values())
+
+
+def scrape_sync(
+    root_url: str, output_dir: Optional[str] = None, concurrency: int = 20
+) -> None:
+    """
+    Runs the asynchronous scrape in a new event loop.
+
+    Args:
+        root_url (str): The Notion Help URL to start scraping from.
+        output_dir (Optional[str]): The directory to write the scraped data to.
+            Defaults to `datasets/notion/raw` under the project root.
+        concurrency (int): The number of webpages fetched concurrently. Default is 20.
+    """
+    asyncio.run(scrape(root_url, output_dir, concurrency))
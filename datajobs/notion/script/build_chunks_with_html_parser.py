@@ -13,7 +13,7 @@ if __name__ == "__main__":
 
     project_root = os.getenv("PROJECT_ROOT")
     input_dir = os.path.join(project_root, "datasets", "notion", "raw")
-    input_file_path = os.path.join(input_dir, "data.json")
+    input_file_path = os.path.join(input_dir, "results.jsonl")
     output_dir = os.path.join(
         project_root, "datasets", "notion", "processed", "html_parser"
     )
@@ -23,5 +23,6 @@ if __name__ == "__main__":
         inseparable_tags=["li"],
         chunk_size=750,
         chunk_size_buffer=30,
+        parser="lxml",
     )
-    parse_into_chunks_with_html_parser(input_file_path, output_dir)
+    parse_into_chunks_with_html_parser(input_file_path, output_dir, html_parser)
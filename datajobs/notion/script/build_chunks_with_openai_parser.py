@@ -14,7 +14,7 @@ if __name__ == "__main__":
 
     project_root = os.getenv("PROJECT_ROOT")
     input_dir = os.path.join(project_root, "datasets", "notion", "raw")
-    input_file_path = os.path.join(input_dir, "data.json")
+    input_file_path = os.path.join(input_dir, "results.jsonl")
     output_dir = os.path.join(
         project_root, "datasets", "notion", "processed", "openai_parser"
     )
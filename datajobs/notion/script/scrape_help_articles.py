@@ -5,7 +5,7 @@ import os
 from dotenv import load_dotenv
 
 # custom packages
-from datajobs.notion.scrape import scrape
+from datajobs.notion.scrape import scrape_sync
 
 
 if __name__ == "__main__":
@@ -15,4 +15,4 @@ if __name__ == "__main__":
     output_dir = os.path.join(project_root, "datasets", "notion", "raw")
 
     NOTION_HELP_PAGE_URL = "https://notion.so/help"
-    scrape(NOTION_HELP_PAGE_URL, output_dir)
+    scrape_sync(NOTION_HELP_PAGE_URL, output_dir)
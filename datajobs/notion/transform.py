@@ -1,32 +1,45 @@
 # native Python packages
+import asyncio
 import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional, List
+from functools import partial
+from itertools import islice
+from typing import Optional, List, Tuple, Union
 
 # third-party packages
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
 
 # custom packages
-from utils.file_io import read_json, write_to_json
+from utils.file_io import decompress_from_base64, read_jsonl, write_to_json
 from utils.logger import get_console_logger
 from utils.parser.html_parser import HtmlParser
 from utils.parser.openai_parser import OpenAIParser
+from utils.schema import Chunk
 
+# Number of scraped pages handed to the process pool at a time, which bounds how much of the raw corpus is in memory
+HTML_PARSER_BATCH_SIZE = 256
 
-def extract_articles(text: str) -> List[str]:
+logger = get_console_logger(__name__)
+
+
+def extract_articles(text: Union[str, bytes]) -> List[Tag]:
     """
     Extracts the articles from the Notion help article.
 
     Moreover, it removes asides which are used to organize the table of contents on Notion help articles.
 
     Args:
-        text (str): HTML text of the Notion help article.
+        text (Union[str, bytes]): HTML text of the Notion help article. Bytes are decoded by the HTML parser.
 
     Returns:
-        List[str]: An array of HTML text of the articles.
+        List[Tag]: An array of the parsed articles. They can be passed to HtmlParser as they are, or turned into HTML
+            text with `str`.
     """
-    soup = BeautifulSoup(text, "html.parser")
+    # Everything outside the main section is discarded anyway, so do not build it
+    soup = BeautifulSoup(text, "lxml", parse_only=SoupStrainer("main"))
     main_section = soup.find("main")
 
     if not main_section:
@@ -42,48 +55,74 @@ def extract_articles(text: str) -> List[str]:
         for aside in article.find_all("aside"):
             aside.decompose()
 
-    return [str(article) for article in articles]
+    return articles
+
+
+def _parse_page_with_html_parser(
+    record: dict, html_parser: HtmlParser
+) -> Tuple[str, Optional[List[str]]]:
+    """
+    Parses a scraped page into chunks with the HTML parser.
+
+    This runs in a worker process, so the chunks are returned as strings and logging is left to the caller.
+
+    Args:
+        record (dict): The scrape result of the page.
+        html_parser (HtmlParser): The parser used to build the chunks.
+
+    Returns:
+        Tuple[str, Optional[List[str]]]: The URL and the chunks of the page, or None if no article was found.
+    """
+    url = record["url"]
+    try:
+        articles = extract_articles(decompress_from_base64(record["html_body_zstd"]))
+    except RuntimeError:
+        return url, None
+
+    page_chunks = []
+    for article in articles:
+        article_chunks = html_parser.parse(article, url)
+        page_chunks.extend(article_chunks)
+
+    return url, [str(chunk) for chunk in page_chunks]
 
 
 def parse_into_chunks_with_html_parser(
-    input_file_path: str, output_dir: str, html_parser: Optional[HtmlParser] = None
+    input_file_path: str,
+    output_dir: str,
+    html_parser: Optional[HtmlParser] = None,
+    max_workers: Optional[int] = None,
 ):
     if html_parser is None:
         html_parser = HtmlParser()
 
     start_time = time.time()
-    logger = get_console_logger(__name__)
 
     # Read raw data
     url_to_chunks = {}
     skipped_urls = []
-    raw_data = read_json(input_file_path)
-
-    for url, result in raw_data["results"].items():
-        html_body = result["html_body"]
-        try:
-            articles = extract_articles(html_body)
-        except RuntimeError as e:
-            logger.warning(f"Error in extracting articles. Skipping. URL: {url}")
-            skipped_urls.append(url)
-            continue
-
-        page_chunks = []
-        for article in articles:
-            article_chunks = html_parser.parse(article, url)
-            page_chunks.extend(article_chunks)
-
-        url_to_chunks[url] = page_chunks
-
-    # Turn chunks into string for the data write process
-    url_to_chunks = {
-        url: [str(chunk) for chunk in chunks] for url, chunks in url_to_chunks.items()
-    }
+    total_count = 0
+    records = read_jsonl(input_file_path)
+
+    # Pages are parsed independently, so spread them across processes
+    parse_page = partial(_parse_page_with_html_parser, html_parser=html_parser)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        while batch := list(islice(records, HTML_PARSER_BATCH_SIZE)):
+            total_count += len(batch)
+            for url, page_chunks in executor.map(parse_page, batch, chunksize=8):
+                if page_chunks is None:
+                    logger.warning(
+                        f"Error in extracting articles. Skipping. URL: {url}"
+                    )
+                    skipped_urls.append(url)
+                    continue
+
+                url_to_chunks[url] = page_chunks
 
     end_time = time.time()
     elapsed_time = round((end_time - start_time), 2)
     metadata = {
-        "total_count": len(raw_data["results"]),
+        "total_count": total_count,
         "success_count": len(url_to_chunks),
         "skipped_count": len(skipped_urls),
         "success_urls": list(url_to_chunks.keys()),
@@ -112,11 +151,83 @@ def parse_into_chunks_with_html_parser(
     write_to_json(data_filepath, data)
 
 
+def _parse_page_with_openai_parser(
+    url: str, result: dict, openai_parser: OpenAIParser
+) -> Tuple[str, Optional[List[Chunk]]]:
+    """
+    Parses a scraped page into chunks with the OpenAI parser, one article at a time.
+
+    Args:
+        url (str): The URL of the page.
+        result (dict): The scrape result of the page.
+        openai_parser (OpenAIParser): The parser used to build the chunks.
+
+    Returns:
+        Tuple[str, Optional[List[Chunk]]]: The URL and the chunks of the page, or None if no article was found.
+    """
+    logger.info(f"Parsing and building chunks for the url: {url}")
+
+    try:
+        articles = extract_articles(decompress_from_base64(result["html_body_zstd"]))
+    except RuntimeError:
+        return url, None
+
+    page_chunks = []
+    for article in articles:
+        article_chunks = openai_parser.parse(str(article), url)
+        page_chunks.extend(article_chunks)
+
+    return url, page_chunks
+
+
+async def _aparse_pages_with_openai_parser(
+    results: dict, openai_parser: OpenAIParser, max_concurrency: int
+) -> List[Tuple[str, Optional[List[Chunk]]]]:
+    """
+    Parses scraped pages into chunks with the OpenAI parser, sending the API requests concurrently.
+
+    Args:
+        results (dict): The scrape results keyed by URL.
+        openai_parser (OpenAIParser): The parser used to build the chunks.
+        max_concurrency (int): The maximum number of OpenAI API requests in flight.
+
+    Returns:
+        List[Tuple[str, Optional[List[Chunk]]]]: The URL and the chunks of each page in input order,
+            with None as chunks if no article was found.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def parse_article(article: Tag, url: str) -> List[Chunk]:
+        async with semaphore:
+            return await openai_parser.aparse(str(article), url)
+
+    async def parse_page(url: str, result: dict) -> Tuple[str, Optional[List[Chunk]]]:
+        logger.info(f"Parsing and building chunks for the url: {url}")
+
+        try:
+            articles = extract_articles(
+                decompress_from_base64(result["html_body_zstd"])
+            )
+        except RuntimeError:
+            return url, None
+
+        article_chunks = await asyncio.gather(
+            *(parse_article(article, url) for article in articles)
+        )
+        return url, [chunk for chunks in article_chunks for chunk in chunks]
+
+    tasks = [
+        asyncio.create_task(parse_page(url, result)) for url, result in results.items()
+    ]
+    return await asyncio.gather(*tasks)
+
+
 def parse_into_chunks_with_openai_parser(
     input_file_path: str,
     output_dir: str,
     openai_parser: Optional[OpenAIParser] = None,
     target_urls: Optional[List[str]] = None,
+    max_concurrency: int = 10,
 ):
     if openai_parser is None:
         from dotenv import load_dotenv
@@ -130,37 +241,38 @@ def parse_into_chunks_with_openai_parser(
         openai_parser = OpenAIParser(api_key=api_key)
 
     start_time = time.time()
-    logger = get_console_logger(__name__)
 
     # Read raw data
     url_to_chunks = {}
     skipped_urls = []
-    raw_data = read_json(input_file_path)
-
-    # If target_urls are provided, only process the target URLs
-    if target_urls:
-        target_results = {}
-        for url in target_urls:
-            if url in raw_data["results"]:
-                target_results[url] = raw_data["results"][url]
-        raw_data["results"] = target_results
+    results = {}
 
-    for url, result in raw_data["results"].items():
-        logger.info(f"Parsing and building chunks for the url: {url}")
+    # If target_urls are provided, only keep the target URLs in memory
+    target_url_set = set(target_urls or [])
+    for record in read_jsonl(input_file_path):
+        if not target_url_set or record["url"] in target_url_set:
+            results[record["url"]] = record
 
-        html_body = result["html_body"]
-        try:
-            articles = extract_articles(html_body)
-        except RuntimeError as e:
+    if target_urls:
+        results = {url: results[url] for url in target_urls if url in results}
+
+    # The OpenAI API calls are network bound, so send them concurrently unless there is only a single page
+    if max_concurrency > 1 and len(results) > 1:
+        page_results = asyncio.run(
+            _aparse_pages_with_openai_parser(results, openai_parser, max_concurrency)
+        )
+    else:
+        page_results = [
+            _parse_page_with_openai_parser(url, result, openai_parser)
+            for url, result in results.items()
+        ]
+
+    for url, page_chunks in page_results:
+        if page_chunks is None:
             logger.warning(f"Error in extracting articles. Skipping. URL: {url}")
             skipped_urls.append(url)
             continue
 
-        page_chunks = []
-        for article in articles:
-            article_chunks = openai_parser.parse(article, url)
-            page_chunks.extend(article_chunks)
-
         url_to_chunks[url] = page_chunks
 
     # Turn chunks into string for the data write process
@@ -171,7 +283,7 @@ def parse_into_chunks_with_openai_parser(
     end_time = time.time()
     elapsed_time = round((end_time - start_time), 2)
     metadata = {
-        "total_count": len(raw_data["results"]),
+        "total_count": len(results),
         "success_count": len(url_to_chunks),
         "skipped_count": len(skipped_urls),
         "success_urls": list(url_to_chunks.keys()),
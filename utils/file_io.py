@@ -1,11 +1,39 @@
-import json
+import base64
+from typing import Iterable, Iterator
+
+import orjson
+import zstandard
 
 
 def read_json(file_path: str) -> dict:
-    with open(file_path, "r") as file:
-        return json.load(file)
+    with open(file_path, "rb") as file:
+        return orjson.loads(file.read())
 
 
 def write_to_json(file_path: str, data: dict):
-    with open(file_path, "w") as file:
-        json.dump(data, file, indent=4)
+    with open(file_path, "wb") as file:
+        file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def read_jsonl(file_path: str) -> Iterator[dict]:
+    with open(file_path, "rb") as file:
+        for line in file:
+            yield orjson.loads(line)
+
+
+def write_jsonl(file_path: str, records: Iterable[dict]):
+    with open(file_path, "wb") as file:
+        for record in records:
+            file.write(orjson.dumps(record))
+            file.write(b"\n")
+
+
+def compress_to_base64(data: bytes, level: int = 3) -> str:
+    """Compresses bytes with zstd and encodes them as base64 so they can be stored in a JSON string."""
+    compressed = zstandard.ZstdCompressor(level=level).compress(data)
+    return base64.b64encode(compressed).decode("ascii")
+
+
+def decompress_from_base64(data: str) -> bytes:
+    """Reverses `compress_to_base64`."""
+    return zstandard.ZstdDecompressor().decompress(base64.b64decode(data))
@@ -1,8 +1,8 @@
 # Native Python packages
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
 
 # Third-party packages
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
 
 # Custom packages
@@ -19,6 +19,7 @@ class HtmlParser:
         inseparable_tags: Optional[List] = None,
         chunk_size: Optional[int] = 750,
         chunk_size_buffer: Optional[int] = 30,
+        parser: Optional[str] = "lxml",
     ):
         if tags is None:
             tags = self.DEFAULT_TAGS
@@ -27,52 +28,69 @@ class HtmlParser:
             inseparable_tags = self.DEFAULT_INSEPARABLE_TAGS
 
         self.tags = tags
+        self._tag_names = set(tags)
+        self._strainer = SoupStrainer(tags)
         self.inseparable_tags = set(inseparable_tags)
         self.chunk_size = chunk_size
         self.chunk_size_buffer = chunk_size_buffer
+        self.parser = parser
 
     @staticmethod
-    def _commit_chunk(chunks: List[Chunk], current_chunk: Chunk):
+    def _commit_chunk(
+        chunks: List[Chunk], text_parts: List[str], nodes: List[Node], url: str
+    ):
         """
-        Commits the current chunk to the list of chunks.
+        Joins the buffered text parts into a chunk and commits it to the list of chunks.
 
         Args:
             chunks (List[Chunk]): list of chunks.
-            current_chunk (Chunk): current chunk to commit.
+            text_parts (List[str]): text parts of the current chunk.
+            nodes (List[Node]): nodes of the current chunk.
+            url (str): url of the webpage.
         """
-        current_chunk.text = current_chunk.text.strip()
-        if current_chunk.text:
-            chunks.append(current_chunk)
+        text = "".join(text_parts).strip()
+        if text:
+            chunks.append(Chunk(text, nodes, metadata={"url": url}))
 
-    def _split_text_into_tags(self, text: str) -> List[Tag]:
+    def _split_text_into_tags(self, text: Union[str, Tag]) -> List[Tuple[str, str]]:
         """
         Splits text into tags based on the specified tags.
 
         It uses BeautifulSoup to parse the text and extract the specified tags by recursively traversing the HTML page.
+        Only child tags are visited, and the traversal does not descend into a tag once it matches.
+        Tags without text are dropped, and the text of the others is extracted once here so it is not re-serialized later.
+        An already parsed tag is traversed as it is, without serializing and parsing it again.
 
         Args:
-            text (str): text to split.
+            text (Union[str, Tag]): text or parsed tag to split.
 
         Returns:
-            List[Tag]: list of tags.
+            List[Tuple[str, str]]: list of (tag name, stripped tag text) pairs.
         """
         tags = []
 
-        def traverse(tag):
-            if isinstance(tag, Tag):
-                if tag.name in self.tags:
-                    if tag.get_text().strip():
-                        tags.append(tag)
+        def traverse(elements):
+            for element in elements:
+                if not isinstance(element, Tag):
+                    continue
+
+                if element.name in self._tag_names:
+                    element_text = element.get_text().strip()
+                    if element_text:
+                        tags.append((element.name, element_text))
                 else:
-                    for child in tag.children:
-                        traverse(child)
+                    traverse(element.contents)
 
-        soup = BeautifulSoup(text, "html.parser")
-        traverse(soup)
+        if isinstance(text, Tag):
+            traverse([text])
+        else:
+            # Only build the subtrees of the specified tags
+            soup = BeautifulSoup(text, self.parser, parse_only=self._strainer)
+            traverse(soup.contents)
 
         return tags
 
-    def _convert_tags_to_nodes(self, tags: List[Tag]) -> List[Node]:
+    def _convert_tags_to_nodes(self, tags: List[Tuple[str, str]]) -> List[Node]:
         """
         Converts tags into nodes.
 
@@ -81,48 +99,44 @@ class HtmlParser:
         ensure tags such as list items from the same section are consolidated into a single node.
 
         Args:
-            tags (List[Tag]): list of tags.
+            tags (List[Tuple[str, str]]): list of (tag name, stripped tag text) pairs.
 
         Returns:
             List[Node]: list of nodes.
         """
         nodes = []
 
-        for tag in tags:
-            tag_text = tag.get_text().strip()
-            if not tag_text:
-                continue
-
+        for tag_name, tag_text in tags:
             # Add a newline character to the end of the tag text
             tag_text = f"{tag_text}\n"
 
             if (
-                tag.name in self.inseparable_tags
+                tag_name in self.inseparable_tags
                 and nodes
-                and nodes[-1].tag == tag.name
+                and nodes[-1].tag == tag_name
             ):
                 nodes[-1].text += tag_text
             else:
-                node = Node(tag_text, tag.name)
+                node = Node(tag_text, tag_name)
                 nodes.append(node)
 
         return nodes
 
     def _is_valid_chunk_size(
-        self, current_chunk_text: str, new_chunk_text: str
+        self, current_chunk_size: int, new_chunk_text: str
     ) -> bool:
         """
         Checks if the new chunk text can be added to the current chunk text without exceeding the chunk size.
 
         Args:
-            current_chunk_text (str): current chunk text.
+            current_chunk_size (int): length of the current chunk text.
             new_chunk_text (str): new node text.
 
         Returns:
             bool: True if the new node text can be added to the current chunk text, False otherwise.
         """
         return (
-            len(current_chunk_text) + len(new_chunk_text)
+            current_chunk_size + len(new_chunk_text)
             <= self.chunk_size + self.chunk_size_buffer
         )
 
@@ -141,7 +155,11 @@ class HtmlParser:
             return []
 
         chunks = []
-        current_chunk = Chunk(metadata={"url": url})
+        # Buffer the text parts of the current chunk and only join them on commit, instead of
+        # re-allocating the growing chunk text for every node
+        current_text_parts = []
+        current_size = 0
+        current_nodes = []
 
         for node in nodes:
             new_node_text = node.text.strip()
@@ -150,27 +168,26 @@ class HtmlParser:
 
             new_node_text_with_newline = f"{new_node_text}\n"
 
-            if self._is_valid_chunk_size(
-                current_chunk.text, new_node_text_with_newline
-            ):
-                current_chunk.text += new_node_text_with_newline
-                current_chunk.nodes.append(node)
+            if self._is_valid_chunk_size(current_size, new_node_text_with_newline):
+                current_text_parts.append(new_node_text_with_newline)
+                current_size += len(new_node_text_with_newline)
+                current_nodes.append(node)
             else:
-                self._commit_chunk(chunks, current_chunk)
-                current_chunk = Chunk(
-                    new_node_text_with_newline, [node], metadata={"url": url}
-                )
+                self._commit_chunk(chunks, current_text_parts, current_nodes, url)
+                current_text_parts = [new_node_text_with_newline]
+                current_size = len(new_node_text_with_newline)
+                current_nodes = [node]
 
-        if current_chunk.text.strip():
-            self._commit_chunk(chunks, current_chunk)
+        self._commit_chunk(chunks, current_text_parts, current_nodes, url)
 
         return chunks
 
-    def parse(self, text: str, url: str) -> List[Chunk]:
+    def parse(self, text: Union[str, Tag], url: str) -> List[Chunk]:
         """Parses text into chunks that can be used for embedding / loaded into vector database.
 
         Args:
-            text (str): text to parse. Should be the html content of a webpage.
+            text (Union[str, Tag]): text to parse. Should be the html content of a webpage, or an already parsed tag
+                of it that is used as it is.
             url (str): url of the webpage.
 
         Returns:
@@ -3,7 +3,7 @@ import json
 
 
 # Third-party packages
-from openai import OpenAI, Completion
+from openai import AsyncOpenAI, OpenAI, Completion
 
 # custom packages
 from utils.schema import Chunk
@@ -37,6 +37,7 @@ class OpenAIParser:
         self.api_key = api_key
         self.model = model
         self.client = OpenAI(api_key=api_key)
+        self.async_client = AsyncOpenAI(api_key=api_key)
         self.chunk_size = chunk_size
         self.chunk_size_buffer = chunk_size_buffer
         self.prompt = prompt
@@ -57,6 +58,17 @@ class OpenAIParser:
         )
         return response
 
+    async def _amake_request(self, text: str) -> Completion:
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": f"{self.prompt}"},
+                {"role": "user", "content": text},
+            ],
+        )
+        return response
+
     def _convert_response_to_chunks(
         self, response: Completion, url: str
     ) -> List[Chunk]:
@@ -75,3 +87,8 @@ class OpenAIParser:
         """Parse the given HTML content to extract the text content and return a list of chunks using OpenAI API."""
         response = self._make_request(text)
         return self._convert_response_to_chunks(response, url)
+
+    async def aparse(self, text: str, url: str):
+        """Asynchronous version of `parse` that awaits the OpenAI API call so requests can run concurrently."""
+        response = await self._amake_request(text)
+        return self._convert_response_to_chunks(response, url)